@@ -1,64 +1,145 @@
 import logging
-from typing import Generator
+import re
+import threading
+from collections import OrderedDict
+from typing import Generator, List
 
 try:
     from llama_cpp import Llama
 except Exception:  # pragma: no cover
     Llama = None
 
+# Simple instruction prompt without memory / RAG. The prefix is identical
+# for every request, so llama.cpp keeps its evaluated tokens in the KV
+# cache and only the user text and suffix are evaluated per turn.
+PROMPT_PREFIX = (
+    "You are a concise helpful assistant running fully offline on a "
+    "small device. Answer briefly.\n\nUser: "
+)
+PROMPT_SUFFIX = "\nAssistant:"
+STOP_SEQUENCES = ["User:", "Assistant:"]
+
+_NON_WORD = re.compile(r"[^\w]+")
+
 
 class LlmChat:
     """
     Offline LLM chat using llama.cpp bindings.
     Loads GGUF model from models/llm.gguf.
+
+    The model is loaded by load(), intended to run on a background thread at
+    boot. A chat request that arrives first waits for it (or loads the model
+    itself if load() was never called).
+
+    Completed replies are kept in a small LRU keyed on the normalized
+    question, so asking the same thing again answers without a decode.
+    A cached question always gets the same reply back; the sampled
+    variation of a fresh decode is lost until it falls out of the LRU.
     """
 
+    RESPONSE_CACHE_SIZE = 32
+
     def __init__(self, model_path: str = "models/llm.gguf") -> None:
         self.log = logging.getLogger("llm")
+        self.model_path = model_path
         self._llm = None
+        self._load_attempted = False
+        # Serializes loading, warmup and generation on the single context.
+        self._lock = threading.Lock()
+        self._responses: "OrderedDict[str, str]" = OrderedDict()
+
+    def load(self) -> None:
+        """
+        Loads the model and evaluates the fixed prompt prefix once, so the
+        weights are paged in and the prefix is already in the KV cache when
+        the first question arrives.
+        """
+        with self._lock:
+            self._load_locked()
+
+    def _load_locked(self) -> None:
+        if self._load_attempted:
+            return
+        self._load_attempted = True
         try:
             if Llama is None:
                 raise RuntimeError("llama_cpp is not installed.")
+            # Weights are mmapped and left pageable rather than mlocked, so
+            # the kernel can share the 4 GB with YOLO and Vosk. Prompts are
+            # short, so a smaller batch keeps the compute buffers small.
             self._llm = Llama(
-                model_path=model_path,
+                model_path=self.model_path,
                 n_ctx=2048,
                 n_threads=4,
+                n_batch=128,
+                use_mmap=True,
+                use_mlock=False,
                 embedding=False,
             )
         except Exception as e:
             self.log.exception("Failed to load LLM model: %s", e)
+            return
+
+        try:
+            self._llm(PROMPT_PREFIX, max_tokens=1)
+            self.log.info("LLM loaded and warmed up.")
+        except Exception:
+            self.log.exception("LLM warmup failed.")
 
     def stream_chat(self, prompt: str) -> Generator[str, None, None]:
         """
         Stateless single-turn chat.
         Streams tokens as they are generated.
         """
-        if self._llm is None:
-            self.log.error("LLM not available.")
+        key = self._cache_key(prompt)
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._responses.move_to_end(key)
+        if cached is not None:
+            # Yielded outside the lock; the caller may hold the generator
+            # open while it speaks the reply.
+            self.log.info("LLM response cache hit.")
+            yield cached
             return
 
-        try:
-            # Simple instruction prompt without memory / RAG.
-            full_prompt = (
-                "You are a concise helpful assistant running fully offline on a "
-                "small device. Answer briefly.\n\nUser: "
-                + prompt
-                + "\nAssistant:"
-            )
+        with self._lock:
+            self._load_locked()
+            if self._llm is None:
+                self.log.error("LLM not available.")
+                return
 
-            for token in self._llm(
-                full_prompt,
-                max_tokens=256,
-                stop=["User:", "Assistant:"],
-                stream=True,
-            ):
-                try:
-                    part = token.get("choices", [{}])[0].get("text", "")
-                except Exception:
-                    part = ""
-                if part:
-                    yield part
-        except Exception:
-            self.log.exception("LLM streaming failed.")
-            return
+            parts: List[str] = []
+            finish_reason = None
+            try:
+                for token in self._llm(
+                    PROMPT_PREFIX + prompt + PROMPT_SUFFIX,
+                    max_tokens=256,
+                    stop=STOP_SEQUENCES,
+                    stream=True,
+                ):
+                    try:
+                        choice = token.get("choices", [{}])[0]
+                        part = choice.get("text", "")
+                        finish_reason = choice.get("finish_reason") or finish_reason
+                    except Exception:
+                        part = ""
+                    if part:
+                        parts.append(part)
+                        yield part
+            except Exception:
+                self.log.exception("LLM streaming failed.")
+                return
+
+            # Only replies that ended on their own are cached; one cut off
+            # at max_tokens ("length") would otherwise be replayed as-is.
+            response = "".join(parts)
+            if key and finish_reason == "stop" and response.strip():
+                self._responses[key] = response
+                if len(self._responses) > self.RESPONSE_CACHE_SIZE:
+                    self._responses.popitem(last=False)
+
+    @staticmethod
+    def _cache_key(prompt: str) -> str:
+        return _NON_WORD.sub(" ", prompt.lower()).strip()
 
@@ -1,15 +1,18 @@
+import importlib.util
 import logging
 import os
 import time
 from datetime import datetime
-from typing import Optional, Tuple
-import sys
+from typing import Optional
+
+from hardware.camera import Camera
 
-sys.path.append("/usr/lib/python3/dist-packages")
 try:
-    from picamera2 import Picamera2
+    import numpy as np
+    from PIL import Image
 except Exception:  # pragma: no cover
-    Picamera2 = None
+    np = None
+    Image = None
 
 try:
     from ultralytics import YOLO
@@ -20,91 +23,159 @@ except Exception:  # pragma: no cover
 class VisionSystem:
     """
     Handles camera capture and optional YOLOv8 object detection.
+
+    Detection runs on the ONNX export of the model (models/yolo.onnx, made
+    by scripts/download_models.py) through onnxruntime when both are
+    present, which is several times faster on the Pi's CPU than PyTorch.
+    YOLO_BACKEND=pytorch forces the original .pt model.
     """
 
+    # Detection runs a cheap low-resolution pass first and only escalates
+    # when nothing confident enough is found. The last pass at the model's
+    # native 640 px keeps small or distant objects detectable.
+    YOLO_FAST_IMAGE_SIZE = 192
+    YOLO_IMAGE_SIZE = 320
+    YOLO_FULL_IMAGE_SIZE = 640
+    YOLO_CONFIDENCE = 0.25
+
     def __init__(
         self,
+        camera: Camera,
         yolo_model_path: str = "models/yolo.pt",
         image_dir: str = "storage/images",
     ) -> None:
         self.log = logging.getLogger("vision")
+        self.camera = camera
         self.image_dir = image_dir
         os.makedirs(self.image_dir, exist_ok=True)
 
-        self.cam = None
-        try:
-            if Picamera2 is None:
-                raise RuntimeError("Picamera2 not available.")
-            self.cam = Picamera2()
-            self.cam.configure(self.cam.create_still_configuration())
-            self.cam.start()
-        except Exception as e:
-            self.log.exception("Failed to initialize camera: %s", e)
-            self.cam = None
-
         self.yolo = None
         try:
             if YOLO is None:
                 raise RuntimeError("ultralytics YOLO not available.")
-            self.yolo = YOLO(yolo_model_path)
+            self.yolo = YOLO(self._resolve_model_path(yolo_model_path), task="detect")
         except Exception as e:
             self.log.exception("Failed to load YOLO model: %s", e)
             self.yolo = None
 
+    def _resolve_model_path(self, pt_path: str) -> str:
+        if os.environ.get("YOLO_BACKEND", "onnx").lower() != "onnx":
+            return pt_path
+        onnx_path = os.path.splitext(pt_path)[0] + ".onnx"
+        if not os.path.exists(onnx_path):
+            self.log.info("No %s, using PyTorch YOLO.", onnx_path)
+            return pt_path
+        if importlib.util.find_spec("onnxruntime") is None:
+            self.log.warning("onnxruntime not installed, using PyTorch YOLO.")
+            return pt_path
+        self.log.info("Using ONNX YOLO model %s", onnx_path)
+        return onnx_path
+
     # -------------------------------------------------
     # Capture helpers
     # -------------------------------------------------
-    def _capture_image(self) -> Optional[str]:
-        if self.cam is None:
+    def new_capture_path(self) -> str:
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return os.path.join(self.image_dir, f"capture_{ts}.jpg")
+
+    def _capture_detection_frame(self):
+        """
+        Returns a BGR frame for YOLO, or None. Detection only needs the
+        small stream; the lores frame is the camera's reusable buffer and
+        is consumed before the next capture.
+        """
+        if not self.camera.available:
             self.log.error("Camera not available.")
             return None
+        if self.camera.has_lores:
+            return self.camera.capture_array("lores")
+        # Main is stored R, G, B; swap to the order YOLO expects.
+        frame = self.camera.capture_array("main")
+        return None if frame is None else np.ascontiguousarray(frame[..., ::-1])
+
+    # -------------------------------------------------
+    # Feature 2 – image capture only
+    # -------------------------------------------------
+    def snap_array(self):
+        """
+        Grab a frame from the running camera (fast). Returns None on failure.
+
+        The main-stream frame is a fresh copy, so it can be handed to a
+        background writer as is.
+        """
+        return self.camera.capture_array()
+
+    def save_jpeg(self, frame, path: str) -> Optional[str]:
+        """
+        Encode and write a frame from snap_array() (slow, SD card bound).
+        Intended to run off the main thread.
+        """
+        if Image is None:
+            self.log.error("Pillow not available, cannot save image.")
+            return None
         try:
-            ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-            path = os.path.join(self.image_dir, f"capture_{ts}.jpg")
-            self.cam.capture_file(path)
-            self.log.info("Captured image %s", path)
+            Image.fromarray(frame).save(path, format="JPEG", quality=85)
+            self.log.info("Saved image %s", path)
             return path
         except Exception:
-            self.log.exception("Failed to capture image.")
+            self.log.exception("Failed to save image %s", path)
             return None
 
-    # Feature 2 – image capture only
-    def capture_and_save_image(self) -> Optional[str]:
-        return self._capture_image()
-
     # -------------------------------------------------
     # Feature 1 – object detection
     # -------------------------------------------------
-    def detect_first_object(self) -> Tuple[Optional[str], Optional[str]]:
-        """
-        Returns (image_path, first_label)
+    def detect_first_object(self) -> Optional[str]:
         """
-        image_path = self._capture_image()
-        if image_path is None:
-            return None, None
+        Returns the first label detected in a fresh frame, or None.
 
+        The frame goes straight from the camera buffer to YOLO; nothing is
+        encoded or written to disk.
+        """
         if self.yolo is None:
             self.log.error("YOLO model not available.")
-            return image_path, None
+            return None
+
+        frame = self._capture_detection_frame()
+        if frame is None:
+            return None
 
         try:
             self.log.info("Running YOLO detection (may take 30s+ on first run)...")
-            results = self.yolo(image_path, verbose=False)
-            if not results:
-                self.log.info("YOLO returned no results.")
-                return image_path, None
-
-            r = results[0]
-            if r.boxes is None or len(r.boxes) == 0:
-                self.log.info("No objects detected in image.")
-                return image_path, None
-
-            box = r.boxes[0]
-            cls_idx = int(box.cls[0].item())
-            label = r.names.get(cls_idx, str(cls_idx))
-            self.log.info("Detected object: %s", label)
-            return image_path, label
+            for imgsz in (
+                self.YOLO_FAST_IMAGE_SIZE,
+                self.YOLO_IMAGE_SIZE,
+                self.YOLO_FULL_IMAGE_SIZE,
+            ):
+                label = self._detect_label(frame, imgsz)
+                if label:
+                    self.log.info("Detected object: %s (imgsz=%d)", label, imgsz)
+                    return label
+
+            self.log.info("No objects detected in image.")
+            return None
         except Exception:
             self.log.exception("YOLO detection failed.")
-            return image_path, None
+            return None
+
+    def _detect_label(self, source, imgsz: int) -> Optional[str]:
+        """
+        Returns the label of the most confident detection at the given input
+        size, or None.
+        """
+        results = self.yolo.predict(
+            source,
+            imgsz=imgsz,
+            conf=self.YOLO_CONFIDENCE,
+            max_det=1,
+            verbose=False,
+        )
+        if not results:
+            return None
+
+        r = results[0]
+        if r.boxes is None or len(r.boxes) == 0:
+            return None
+
+        cls_idx = int(r.boxes[0].cls[0].item())
+        return r.names.get(cls_idx, str(cls_idx))
 
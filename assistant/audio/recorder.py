@@ -1,7 +1,7 @@
 import logging
-import tempfile
-import wave
-from typing import Optional
+import queue
+import threading
+from typing import Callable, Optional
 
 try:
     import sounddevice as sd
@@ -11,76 +11,166 @@ except Exception:  # pragma: no cover
 
 class AudioRecorder:
     """
-    Simple blocking recorder using sounddevice.
+    Push-to-talk recorder using a persistent sounddevice callback stream.
 
-    For push-to-talk:
-      - start(): begin recording into an in-memory buffer
-      - stop(): write buffer to temp WAV file and return path
+    - start(): begin recording into an in-memory buffer, optionally
+      handing each block to `on_chunk` as it arrives
+    - stop_pcm(): stop and return the captured 16-bit PCM
+
+    The input stream is opened on first use and kept for the life of the
+    process; start()/stop_pcm() only start and stop it, so a press does not
+    pay for PortAudio/ALSA device setup. close() releases it on shutdown.
+
+    Samples are captured as int16 straight into a buffer preallocated for
+    `max_seconds` of audio; anything beyond that is dropped. The stream
+    delivers `blocksize` frames per callback (256 ms at 16 kHz), which is
+    ample granularity for push-to-talk and keeps the callback rate low.
+
+    `on_chunk` never runs on the PortAudio callback thread: blocks are
+    passed through a bounded queue to a consumer thread, so a slow consumer
+    cannot cause capture overruns. If it falls more than CHUNK_BACKLOG
+    blocks behind, further blocks are dropped for it (the recording itself
+    is still complete).
     """
 
-    def __init__(self, samplerate: int = 16000, channels: int = 1) -> None:
+    CHUNK_BACKLOG = 16
+
+    SAMPLE_WIDTH = 2  # 16-bit
+
+    def __init__(
+        self,
+        samplerate: int = 16000,
+        channels: int = 1,
+        max_seconds: int = 30,
+        blocksize: int = 4096,
+    ) -> None:
         self.log = logging.getLogger("recorder")
         self.samplerate = samplerate
         self.channels = channels
-        self._buffer = []
+        self.blocksize = blocksize
+        self._pcm = bytearray(samplerate * channels * self.SAMPLE_WIDTH * max_seconds)
+        self._pcm_view = memoryview(self._pcm)
+        self._pcm_len = 0
+        self._overflowed = False
         self._stream = None
+        self._chunks: Optional[queue.Queue] = None
+        self._chunk_thread: Optional[threading.Thread] = None
+        self._dropped_chunks = 0
+
+    @property
+    def dropped_chunks(self) -> int:
+        """Blocks not delivered to on_chunk during the last recording."""
+        return self._dropped_chunks
+
+    def _callback(self, indata, frames, time_info, status) -> None:
+        if status:
+            self.log.warning("Recorder status: %s", status)
+        data = memoryview(indata).cast("B")
+        end = min(self._pcm_len + len(data), len(self._pcm))
+        n = end - self._pcm_len
+        if n < len(data):
+            self._overflowed = True
+        self._pcm_view[self._pcm_len:end] = data[:n]
+        self._pcm_len = end
+        chunks = self._chunks
+        if chunks is not None and n:
+            try:
+                chunks.put_nowait(bytes(data[:n]))
+            except queue.Full:
+                self._dropped_chunks += 1
+
+    def _drain_chunks(
+        self, chunks: queue.Queue, on_chunk: Callable[[bytes], None]
+    ) -> None:
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            try:
+                on_chunk(chunk)
+            except Exception:
+                self.log.exception("Audio chunk consumer failed.")
 
-    def start(self) -> None:
+    def _start_consumer(self, on_chunk: Callable[[bytes], None]) -> None:
+        self._dropped_chunks = 0
+        self._chunks = queue.Queue(maxsize=self.CHUNK_BACKLOG)
+        self._chunk_thread = threading.Thread(
+            target=self._drain_chunks,
+            args=(self._chunks, on_chunk),
+            name="audio-chunk-thread",
+            daemon=True,
+        )
+        self._chunk_thread.start()
+
+    def _stop_consumer(self) -> None:
+        chunks, thread = self._chunks, self._chunk_thread
+        if chunks is None or thread is None:
+            return
+        self._chunks = None
+        self._chunk_thread = None
+        # The stream is stopped, so nothing else is queued after the sentinel.
+        chunks.put(None)
+        thread.join()
+        if self._dropped_chunks:
+            self.log.warning(
+                "Dropped %d audio chunks for a slow consumer.", self._dropped_chunks
+            )
+
+    def start(self, on_chunk: Optional[Callable[[bytes], None]] = None) -> None:
         if sd is None:
             self.log.error("sounddevice not available, cannot record.")
             return
         try:
-            self._buffer = []
-
-            def callback(indata, frames, time_info, status):  # type: ignore[override]
-                if status:
-                    self.log.warning("Recorder status: %s", status)
-                self._buffer.append(indata.copy())
-
-            self._stream = sd.InputStream(
-                samplerate=self.samplerate,
-                channels=self.channels,
-                callback=callback,
-            )
+            self._pcm_len = 0
+            self._overflowed = False
+            if on_chunk is not None:
+                self._start_consumer(on_chunk)
+            if self._stream is None:
+                self._stream = sd.InputStream(
+                    samplerate=self.samplerate,
+                    channels=self.channels,
+                    dtype="int16",
+                    blocksize=self.blocksize,
+                    callback=self._callback,
+                )
             self._stream.start()
         except Exception:
             self.log.exception("Failed to start recording.")
-            self._stream = None
-            self._buffer = []
+            self.close()
+            self._stop_consumer()
+            self._pcm_len = 0
 
-    def stop(self) -> Optional[str]:
-        if sd is None:
-            return None
+    def _stop_stream(self) -> None:
         try:
             if self._stream is not None:
                 self._stream.stop()
-                self._stream.close()
         except Exception:
             self.log.exception("Failed to stop recording stream.")
-        finally:
-            self._stream = None
+            # Reopen from scratch on the next start().
+            self.close()
+        self._stop_consumer()
+        if self._overflowed:
+            self.log.warning("Recording exceeded buffer; audio was truncated.")
 
-        try:
-            if not self._buffer:
-                return None
-
-            import numpy as np
-
-            data = np.concatenate(self._buffer, axis=0)
+    def stop_pcm(self) -> Optional[bytes]:
+        """
+        Stops recording and returns the captured 16-bit PCM, or None if
+        nothing was recorded.
+        """
+        if sd is None:
+            return None
+        self._stop_stream()
+        if self._pcm_len == 0:
+            return None
+        return bytes(self._pcm_view[: self._pcm_len])
 
-            tmp = tempfile.NamedTemporaryFile(
-                suffix=".wav", delete=False, prefix="assistant_audio_"
-            )
-            with wave.open(tmp, "wb") as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(2)  # 16-bit
-                wf.setframerate(self.samplerate)
-                wf.writeframes((data * 32767).astype("int16").tobytes())
-
-            path = tmp.name
-            self.log.info("Saved audio to %s", path)
-            return path
+    def close(self) -> None:
+        if self._stream is None:
+            return
+        try:
+            self._stream.close()
         except Exception:
-            self.log.exception("Failed to save recorded audio.")
-            return None
+            self.log.exception("Failed to close recording stream.")
+        finally:
+            self._stream = None
 
@@ -1,5 +1,8 @@
+import json
 import logging
-from typing import Optional
+import mmap
+import os
+from typing import Callable, List, Optional
 
 try:
     import vosk
@@ -7,15 +10,46 @@ except Exception:  # pragma: no cover
     vosk = None
 
 
+def prefault_model(path: str) -> None:
+    """
+    Ask the kernel to read the model files into the page cache ahead of use,
+    so the first recognizer call does not fault them in from the SD card.
+    """
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(root, name)
+            try:
+                with open(file_path, "rb") as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        continue
+                    if hasattr(mmap.mmap, "madvise") and hasattr(mmap, "MADV_WILLNEED"):
+                        with mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) as m:
+                            m.madvise(mmap.MADV_WILLNEED)
+                    elif hasattr(os, "posix_fadvise"):
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                logging.getLogger("stt").warning("Could not prefault %s", file_path)
+
+
 class SpeechToText:
     """
     Offline STT using Vosk.
     Expects a model folder at models/vosk/.
     """
 
+    # Frames per AcceptWaveform() call when transcribing a whole buffer
+    # (0.5 s at 16 kHz).
+    FEED_FRAMES = 8000
+
     def __init__(self, model_path: str = "models/vosk") -> None:
         self.log = logging.getLogger("stt")
+        self.model_path = model_path
         self.model = None
+        # Recognizer state for start_stream()/feed()/finish_stream().
+        self._stream_rec = None
+        self._stream_fragments: List[str] = []
+        self._stream_on_partial: Optional[Callable[[str], None]] = None
+        self._stream_last_partial = ""
         try:
             if vosk is None:
                 raise RuntimeError("vosk is not installed.")
@@ -23,38 +57,124 @@ class SpeechToText:
         except Exception as e:
             self.log.exception("Failed to load Vosk model: %s", e)
 
-    def transcribe(self, wav_path: str) -> Optional[str]:
+    def prefault(self) -> None:
+        """
+        Warm the page cache with the model files. Intended to run in a
+        background thread during boot.
+        """
+        try:
+            prefault_model(self.model_path)
+            self.log.info("Prefaulted Vosk model files in %s", self.model_path)
+        except Exception:
+            self.log.exception("Failed to prefault Vosk model.")
+
+    def warmup(self) -> None:
+        """
+        Boot warmup hook shared with WhisperSpeechToText. Vosk has no
+        per-call setup worth paying early, so this only prefaults.
+        """
+        self.prefault()
+
+    def transcribe_pcm(self, pcm: bytes, samplerate: int = 16000) -> Optional[str]:
+        """
+        Transcribes a complete mono 16-bit PCM recording.
+        """
         if self.model is None or vosk is None:
             self.log.error("STT model not available.")
             return None
         try:
-            import wave
-            import json
-
-            wf = wave.open(wav_path, "rb")
-            if wf.getnchannels() != 1 or wf.getsampwidth() != 2:
-                self.log.warning("Unexpected audio format for STT.")
-
-            rec = vosk.KaldiRecognizer(self.model, wf.getframerate())
-            text_fragments = []
-
-            while True:
-                data = wf.readframes(4000)
-                if len(data) == 0:
-                    break
-                if rec.AcceptWaveform(data):
-                    res = json.loads(rec.Result())
-                    if "text" in res and res["text"]:
-                        text_fragments.append(res["text"])
-
-            final_res = json.loads(rec.FinalResult())
-            if "text" in final_res and final_res["text"]:
-                text_fragments.append(final_res["text"])
-
-            full_text = " ".join(text_fragments).strip()
-            self.log.info("STT result: %s", full_text)
-            return full_text
+            rec = vosk.KaldiRecognizer(self.model, samplerate)
+            text_fragments: List[str] = []
+
+            pcm = bytes(pcm)
+            step = self.FEED_FRAMES * 2  # 16-bit mono
+            for offset in range(0, len(pcm), step):
+                self._accept(rec, pcm[offset : offset + step], text_fragments)
+
+            return self._finish(rec, text_fragments)
         except Exception:
             self.log.exception("STT transcription failed.")
             return None
 
+    # -------------------------------------------------
+    # Streaming – fed while recording
+    # -------------------------------------------------
+    def start_stream(
+        self,
+        samplerate: int = 16000,
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> bool:
+        """
+        Prepares a recognizer to be fed audio with feed() while recording is
+        still in progress. Returns False if streaming is unavailable.
+
+        If given, `on_partial` is called from feed() with the transcript so
+        far whenever it changes.
+        """
+        self._stream_rec = None
+        self._stream_fragments = []
+        self._stream_on_partial = on_partial
+        self._stream_last_partial = ""
+        if self.model is None or vosk is None:
+            return False
+        try:
+            self._stream_rec = vosk.KaldiRecognizer(self.model, samplerate)
+            return True
+        except Exception:
+            self.log.exception("Failed to start streaming STT.")
+            return False
+
+    def feed(self, pcm: bytes) -> None:
+        rec = self._stream_rec
+        if rec is None:
+            return
+        final = self._accept(rec, pcm, self._stream_fragments)
+        if self._stream_on_partial is None:
+            return
+
+        text = " ".join(self._stream_fragments)
+        if not final:
+            partial = json.loads(rec.PartialResult()).get("partial", "")
+            if partial:
+                text = (text + " " + partial).strip()
+        if text != self._stream_last_partial:
+            self._stream_last_partial = text
+            self._stream_on_partial(text)
+
+    def finish_stream(self) -> Optional[str]:
+        """
+        Flushes the streaming recognizer and returns the transcript, or None
+        if no stream was active or it failed.
+        """
+        rec, fragments = self._stream_rec, self._stream_fragments
+        self._stream_rec = None
+        self._stream_fragments = []
+        self._stream_on_partial = None
+        if rec is None:
+            return None
+        try:
+            return self._finish(rec, fragments)
+        except Exception:
+            self.log.exception("STT transcription failed.")
+            return None
+
+    def _accept(self, rec, pcm: bytes, text_fragments: List[str]) -> bool:
+        """
+        Feeds one block; returns True if it completed an utterance segment.
+        """
+        if rec.AcceptWaveform(pcm):
+            res = json.loads(rec.Result())
+            if "text" in res and res["text"]:
+                text_fragments.append(res["text"])
+            return True
+        return False
+
+    def _finish(self, rec, text_fragments: List[str]) -> str:
+        final_res = json.loads(rec.FinalResult())
+        if "text" in final_res and final_res["text"]:
+            text_fragments.append(final_res["text"])
+
+        full_text = " ".join(text_fragments).strip()
+        self.log.info("STT result: %s", full_text)
+        return full_text
+
@@ -0,0 +1,168 @@
+import logging
+import os
+from typing import Callable, Optional
+
+from audio.stt import prefault_model
+
+try:
+    import numpy as np
+    from faster_whisper import WhisperModel
+except Exception:  # pragma: no cover
+    np = None
+    WhisperModel = None
+
+
+class WhisperSpeechToText:
+    """
+    Offline STT using faster-whisper (CTranslate2).
+    Expects a converted model folder at models/whisper/.
+
+    Drop-in alternative to SpeechToText, selected with STT_ENGINE=whisper.
+    Whisper decodes a whole recording in one native call and has no
+    incremental mode, so start_stream() reports streaming as unavailable and
+    callers fall back to transcribe_pcm() after recording.
+
+    The model is loaded once and kept for the life of the process, so every
+    button press reuses the same CTranslate2 instance.
+    """
+
+    SAMPLE_RATE = 16000
+    # Matches AudioRecorder's default max_seconds; longer input grows it.
+    MAX_SECONDS = 30
+    # Pi 5 has four cores; CTranslate2 otherwise picks its own count.
+    CPU_THREADS = 4
+    # Silence-skipping for real recordings; encoder cost scales with length.
+    VAD_PARAMETERS = {"min_silence_duration_ms": 500}
+
+    def __init__(
+        self, model_path: str = "models/whisper", language: str = "en"
+    ) -> None:
+        self.log = logging.getLogger("stt")
+        self.model_path = model_path
+        self.language = language
+        self.model = None
+        # Float input for Whisper, reused across calls.
+        self._f32 = None
+        try:
+            if WhisperModel is None:
+                raise RuntimeError("faster-whisper is not installed.")
+            self.model = self._load_model()
+        except Exception as e:
+            self.log.exception("Failed to load Whisper model: %s", e)
+
+    def _load_model(self):
+        """
+        int8 roughly halves RSS and speeds up decoding on the Pi's CPU.
+        STT_COMPUTE_TYPE overrides it; a type the CPU backend rejects falls
+        back to "auto" (fastest supported) and then int8.
+        """
+        # faster-whisper treats a missing path as a Hugging Face repo id and
+        # tries to download it, which just times out on this offline device.
+        if not os.path.isdir(self.model_path):
+            raise RuntimeError(f"Whisper model not found at {self.model_path}")
+        requested = os.environ.get("STT_COMPUTE_TYPE", "int8")
+        candidates = [requested] + [t for t in ("auto", "int8") if t != requested]
+        for compute_type in candidates:
+            try:
+                model = WhisperModel(
+                    self.model_path,
+                    device="cpu",
+                    compute_type=compute_type,
+                    cpu_threads=self.CPU_THREADS,
+                    num_workers=1,
+                )
+            except ValueError as e:
+                self.log.warning(
+                    "Whisper compute type %s unsupported: %s", compute_type, e
+                )
+                continue
+            self.log.info("Loaded Whisper model (compute_type=%s).", compute_type)
+            return model
+        raise RuntimeError("No supported Whisper compute type.")
+
+    def prefault(self) -> None:
+        try:
+            prefault_model(self.model_path)
+            self.log.info("Prefaulted Whisper model files in %s", self.model_path)
+        except Exception:
+            self.log.exception("Failed to prefault Whisper model.")
+
+    def warmup(self) -> None:
+        """
+        Prefaults the model files, then decodes one second of silence so
+        CTranslate2's kernel selection and the mel filterbank setup happen
+        here instead of on the first button press. Runs on the warmup thread.
+        """
+        self.prefault()
+        if self.model is None or np is None:
+            return
+        try:
+            # No VAD here: it would drop the silence and skip the encoder.
+            segments, _info = self.model.transcribe(
+                np.zeros(self.SAMPLE_RATE, dtype=np.float32),
+                language=self.language,
+                beam_size=1,
+            )
+            for _ in segments:  # decoding is lazy
+                pass
+            self.log.info("Whisper warmup done.")
+        except Exception:
+            self.log.exception("Whisper warmup failed.")
+
+    def transcribe_pcm(self, pcm: bytes, samplerate: int = 16000) -> Optional[str]:
+        """
+        Transcribes mono 16-bit PCM; Whisper expects 16 kHz input.
+        """
+        if self.model is None or np is None:
+            self.log.error("STT model not available.")
+            return None
+        if samplerate != self.SAMPLE_RATE:
+            self.log.warning(
+                "Whisper expects %d Hz audio, got %d.", self.SAMPLE_RATE, samplerate
+            )
+        try:
+            audio = self._to_float(pcm)
+            segments, _info = self.model.transcribe(
+                audio,
+                language=self.language,
+                beam_size=1,
+                vad_filter=True,
+                vad_parameters=self.VAD_PARAMETERS,
+            )
+            full_text = " ".join(seg.text.strip() for seg in segments).strip()
+            self.log.info("STT result: %s", full_text)
+            return full_text
+        except Exception:
+            self.log.exception("STT transcription failed.")
+            return None
+
+    def _to_float(self, pcm: bytes):
+        """
+        Scales int16 PCM to [-1, 1) float32 in one pass into the reused
+        buffer. The result is a view, valid until the next call.
+        """
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        n = samples.shape[0]
+        if self._f32 is None or self._f32.shape[0] < n:
+            self._f32 = np.empty(
+                max(n, self.MAX_SECONDS * self.SAMPLE_RATE), dtype=np.float32
+            )
+        out = self._f32[:n]
+        np.multiply(samples, np.float32(1.0 / 32768.0), out=out)
+        return out
+
+    # -------------------------------------------------
+    # Streaming – not supported, see class docstring
+    # -------------------------------------------------
+    def start_stream(
+        self,
+        samplerate: int = 16000,
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> bool:
+        return False
+
+    def feed(self, pcm: bytes) -> None:
+        return
+
+    def finish_stream(self) -> Optional[str]:
+        return None
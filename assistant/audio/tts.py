@@ -1,26 +1,102 @@
 import logging
+import queue
+import re
+import shutil
 import subprocess
+import threading
+from typing import List, Optional, Tuple
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Splits text after sentence-ending punctuation, dropping empty pieces.
+    """
+    return [s for s in (p.strip() for p in _SENTENCE_END.split(text)) if s]
+
+
+def complete_sentences(text: str, start: int = 0) -> Tuple[List[str], int]:
+    """
+    Returns the sentences in text[start:] that are already terminated
+    (punctuation followed by whitespace) and the offset just past them.
+    Used to speak a reply while it is still being generated.
+    """
+    end = start
+    for match in _SENTENCE_END.finditer(text, start):
+        end = match.end()
+    if end == start:
+        return [], start
+    return split_sentences(text[start:end]), end
 
 
 class TextToSpeech:
     """
     Simple offline TTS using `espeak`.
+
+    Utterances are spoken one at a time by a dedicated worker thread.
+    enqueue() returns immediately, so callers can queue one sentence while
+    an earlier one is still being spoken; speak() queues text and waits
+    until everything queued so far has been said.
     """
 
+    # Resolved once per process; speak() then execs the absolute path
+    # instead of searching $PATH on every utterance.
+    _espeak_path: Optional[str] = None
+
     def __init__(self, voice: str = "en") -> None:
         self.log = logging.getLogger("tts")
         self.voice = voice
+        if TextToSpeech._espeak_path is None:
+            TextToSpeech._espeak_path = shutil.which("espeak")
+        if TextToSpeech._espeak_path is None:
+            self.log.error("espeak not found on PATH.")
+
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._worker = threading.Thread(
+            target=self._run, name="tts-thread", daemon=True
+        )
+        self._worker.start()
 
     def speak(self, text: str) -> None:
+        self.enqueue(text)
+        self.wait()
+
+    def enqueue(self, text: str) -> None:
         if not text:
             return
+        self._queue.put(text)
+
+    def wait(self) -> None:
+        """
+        Blocks until every queued utterance has been spoken.
+        """
+        self._queue.join()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._worker.join(timeout=5.0)
+
+    def _run(self) -> None:
+        while True:
+            text = self._queue.get()
+            try:
+                if text is None:
+                    return
+                self._say(text)
+            finally:
+                self._queue.task_done()
+
+    def _say(self, text: str) -> None:
+        if self._espeak_path is None:
+            self.log.error("espeak not available, cannot speak: %s", text)
+            return
         try:
             subprocess.run(
-                ["espeak", "-v", self.voice, text],
+                [self._espeak_path, "-v", self.voice, text],
                 check=False,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
             )
         except Exception:
             self.log.exception("TTS failed for text: %s", text)
-
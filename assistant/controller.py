@@ -1,17 +1,25 @@
 import logging
-import time
-from typing import Optional
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
 
 from hardware.animation import AnimationManager
 from hardware.buttons import ButtonEvent, ButtonEventType
+from hardware.camera import Camera
 from hardware.oled import OledDisplay
 from audio.recorder import AudioRecorder
 from audio.stt import SpeechToText
-from audio.tts import TextToSpeech
+from audio.tts import TextToSpeech, complete_sentences
 from ai.llm import LlmChat
 from ai.vision import VisionSystem
 
 
+# How long a result message stays on the OLED before returning to idle.
+RESULT_HOLD_SEC = 1.5
+NO_AUDIO_HOLD_SEC = 1.0
+
+
 class Controller:
     """
     Central coordinator.
@@ -33,27 +41,46 @@ class Controller:
         self.event_queue = event_queue
 
         # Subsystems
-        self.vision = VisionSystem()
+        self.camera = Camera()
+        self.vision = VisionSystem(self.camera)
         self.recorder = AudioRecorder()
-        self.stt = SpeechToText()
+        self.stt = self._create_stt()
         self.tts = TextToSpeech()
         self.llm = LlmChat()
 
         self._chat_recording = False
+        self._chat_streaming = False
+
+        self._dispatch: Dict[ButtonEventType, Callable[[], None]] = {
+            ButtonEventType.K2_OBJECT_DETECT: self._handle_object_detection,
+            ButtonEventType.K3_SHORT_CAPTURE: self._handle_image_capture,
+            ButtonEventType.K1_LONG_CHAT_START: self._handle_chat_start,
+            ButtonEventType.K1_LONG_CHAT_END: self._handle_chat_end,
+        }
+
+        # Single background writer so saving captures never blocks events.
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="io")
+
+        # Pending "return to idle" after a result message has been shown.
+        self._idle_timer: Optional[threading.Timer] = None
+        self._idle_lock = threading.Lock()
+
+        threading.Thread(
+            target=self._warmup, name="warmup-thread", daemon=True
+        ).start()
 
     # -------------------------------------------------
     # Event entry point
     # -------------------------------------------------
     def handle_event(self, event: ButtonEvent) -> None:
+        # A new press pre-empts any result message still on screen.
+        self._cancel_idle_timer()
+        handler = self._dispatch.get(event.event_type)
+        if handler is None:
+            self.log.warning("No handler for event %s", event)
+            return
         try:
-            if event.event_type == ButtonEventType.K2_OBJECT_DETECT:
-                self._handle_object_detection()
-            elif event.event_type == ButtonEventType.K3_SHORT_CAPTURE:
-                self._handle_image_capture()
-            elif event.event_type == ButtonEventType.K1_LONG_CHAT_START:
-                self._handle_chat_start()
-            elif event.event_type == ButtonEventType.K1_LONG_CHAT_END:
-                self._handle_chat_end()
+            handler()
         except Exception as e:
             self.log.exception("Error handling event %s: %s", event, e)
             self._return_to_idle()
@@ -67,7 +94,7 @@ class Controller:
             self.animation.pause()
             self.oled.show_text(["Object detect..."])
 
-            image, label = self.vision.detect_first_object()
+            label = self.vision.detect_first_object()
             self.log.info("Object detection result: label=%s", label)
 
             if label:
@@ -84,10 +111,9 @@ class Controller:
                 except Exception:
                     self.log.exception("TTS failed for 'no object'.")
 
-            time.sleep(1.5)
+            self._return_to_idle_after(RESULT_HOLD_SEC)
         except Exception:
             self.log.exception("Object detection failed.")
-        finally:
             self._return_to_idle()
 
     # -------------------------------------------------
@@ -99,16 +125,20 @@ class Controller:
             self.animation.pause()
             self.oled.show_text(["Capturing image..."])
 
-            saved_path = self.vision.capture_and_save_image()
-            if saved_path:
+            frame = self.vision.snap_array()
+            if frame is not None:
+                # The JPEG is written in the background; the frame is already
+                # in memory, so report success right away.
+                path = self.vision.new_capture_path()
+                future = self._io_pool.submit(self.vision.save_jpeg, frame, path)
+                future.add_done_callback(self._on_capture_saved)
                 self.oled.show_text(["Image Saved"])
             else:
                 self.oled.show_text(["Save failed"])
 
-            time.sleep(1.5)
+            self._return_to_idle_after(RESULT_HOLD_SEC)
         except Exception:
             self.log.exception("Image capture failed.")
-        finally:
             self._return_to_idle()
 
     # -------------------------------------------------
@@ -120,7 +150,11 @@ class Controller:
             self.animation.pause()
             self.oled.clear()
             self.oled.show_text(["Listening..."])
-            self.recorder.start()
+            # Feed STT while recording so only the tail is left on release.
+            self._chat_streaming = self.stt.start_stream(
+                self.recorder.samplerate, on_partial=self._show_partial_transcript
+            )
+            self.recorder.start(on_chunk=self.stt.feed if self._chat_streaming else None)
             self._chat_recording = True
         except Exception:
             self.log.exception("Failed to start recording for chat.")
@@ -129,27 +163,39 @@ class Controller:
 
     def _handle_chat_end(self) -> None:
         self.log.info("Chat end (button released).")
+        hold_sec = 0.0
         try:
             if not self._chat_recording:
                 self.log.warning("Chat end received but recording was not active.")
                 self._return_to_idle()
                 return
 
-            audio_path = None
+            pcm = None
             try:
-                audio_path = self.recorder.stop()
+                pcm = self.recorder.stop_pcm()
             finally:
                 self._chat_recording = False
 
-            if not audio_path:
+            if not pcm:
+                if self._chat_streaming:
+                    self.stt.finish_stream()
                 self.oled.show_text(["No audio"])
-                time.sleep(1.0)
+                hold_sec = NO_AUDIO_HOLD_SEC
                 return
 
             # STT
             self.oled.show_text(["Transcribing..."])
             try:
-                user_text = self.stt.transcribe(audio_path) or ""
+                user_text = None
+                if self._chat_streaming:
+                    user_text = self.stt.finish_stream()
+                    if self.recorder.dropped_chunks:
+                        # The streamed transcript has gaps; redo it from
+                        # the complete recording.
+                        user_text = None
+                if user_text is None:
+                    user_text = self.stt.transcribe_pcm(pcm, self.recorder.samplerate)
+                user_text = user_text or ""
             except Exception:
                 self.log.exception("STT failed.")
                 user_text = ""
@@ -160,37 +206,128 @@ class Controller:
                     self.tts.speak("I didn't hear anything.")
                 except Exception:
                     self.log.exception("TTS failed after empty STT.")
-                time.sleep(1.5)
+                hold_sec = RESULT_HOLD_SEC
                 return
 
             # LLM
             self.log.info("User said: %s", user_text)
             self.oled.show_text(["Thinking..."])
 
+            # Each finished sentence is queued for TTS as soon as it is
+            # generated, so speech starts while the LLM is still running.
             full_response = ""
+            spoken_upto = 0
             try:
                 for token in self.llm.stream_chat(user_text):
                     full_response += token
                     self.oled.show_streaming_text(full_response)
+                    sentences, spoken_upto = complete_sentences(
+                        full_response, spoken_upto
+                    )
+                    for sentence in sentences:
+                        self.tts.enqueue(sentence)
             except Exception:
                 self.log.exception("LLM streaming failed.")
+            self.oled.show_streaming_text(full_response, force=True)
 
             if not full_response.strip():
                 full_response = "I had a problem answering."
+                spoken_upto = 0
 
             try:
-                self.tts.speak(full_response)
+                self.tts.enqueue(full_response[spoken_upto:].strip())
+                self.tts.wait()
             except Exception:
                 self.log.exception("TTS failed for LLM response.")
 
         except Exception:
             self.log.exception("Chat flow failed.")
+            hold_sec = 0.0
         finally:
-            self._return_to_idle()
+            if hold_sec > 0:
+                self._return_to_idle_after(hold_sec)
+            else:
+                self._return_to_idle()
 
     # -------------------------------------------------
     # Helpers
     # -------------------------------------------------
+    def close(self) -> None:
+        """
+        Release hardware held by the subsystems on shutdown.
+        """
+        self._cancel_idle_timer()
+        # Let pending image writes finish before releasing the camera.
+        self._io_pool.shutdown(wait=True)
+        self.camera.close()
+        self.recorder.close()
+        self.tts.close()
+
+    def _create_stt(self):
+        """
+        Vosk by default; STT_ENGINE=whisper selects faster-whisper, falling
+        back to Vosk if its model cannot be loaded.
+        """
+        if os.environ.get("STT_ENGINE", "vosk").lower() == "whisper":
+            # Imported only when selected: faster-whisper pulls in
+            # CTranslate2 and PyAV, which are not needed with Vosk.
+            from audio.stt_whisper import WhisperSpeechToText
+
+            stt = WhisperSpeechToText()
+            if stt.model is not None:
+                return stt
+            self.log.warning("Whisper STT unavailable, falling back to Vosk.")
+        return SpeechToText()
+
+    def _show_partial_transcript(self, text: str) -> None:
+        # Runs on the recorder's chunk thread while K1 is held. K2/K3 can
+        # still draw from the main thread meanwhile; OledDisplay serializes
+        # the two.
+        self.oled.show_streaming_text(text)
+
+    def _on_capture_saved(self, future: "Future[Optional[str]]") -> None:
+        try:
+            if future.result() is None:
+                self.log.error("Background image save failed.")
+        except Exception:
+            self.log.exception("Background image save failed.")
+
+    def _warmup(self) -> None:
+        """
+        One-shot boot warmup, run off the main thread so event handling is
+        available immediately.
+        """
+        self.stt.warmup()
+        self.llm.load()
+
+    def _return_to_idle_after(self, seconds: float) -> None:
+        """
+        Leave the current message on the OLED and return to idle once
+        `seconds` have passed, without blocking the main thread.
+        """
+        self._cancel_idle_timer()
+        timer = threading.Timer(seconds, self._on_idle_timer)
+        timer.daemon = True
+        with self._idle_lock:
+            self._idle_timer = timer
+        timer.start()
+
+    def _on_idle_timer(self) -> None:
+        with self._idle_lock:
+            # Superseded by a newer event or timer.
+            if self._idle_timer is not threading.current_thread():
+                return
+            self._idle_timer = None
+            self._return_to_idle()
+
+    def _cancel_idle_timer(self) -> None:
+        # Taking the lock also waits out a timer that is already firing, so
+        # it cannot resume the animation underneath the new event.
+        with self._idle_lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+
     def _return_to_idle(self) -> None:
         try:
             self.oled.clear()
@@ -1,13 +1,15 @@
 import logging
 import threading
 import time
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from .oled import OledDisplay
 
 try:
+    import numpy as np
     from PIL import Image, ImageDraw
 except Exception:  # pragma: no cover
+    np = None
     Image = None
     ImageDraw = None
 
@@ -20,11 +22,25 @@ class AnimationManager:
     used as the target of the single animation thread.
     """
 
+    # Upper bound on cached packed frames (1 KB each); the idle loop only
+    # cycles through a few dozen geometries.
+    FRAME_CACHE_MAX = 256
+
     def __init__(self, oled: OledDisplay) -> None:
         self.log = logging.getLogger("animation")
         self.oled = oled
-        self._pause_event = threading.Event()
+        # Set while the animation may run; the thread blocks on it while
+        # paused instead of polling.
+        self._run_event = threading.Event()
+        self._run_event.set()
         self._stop_event = threading.Event()
+        # Set by pause()/stop() to cut short the waits between animation
+        # steps, so the loop reacts immediately instead of finishing its
+        # 5 s sequence.
+        self._interrupt = threading.Event()
+        # Held while a frame is sent; pause() takes it so no eye frame can
+        # land on the OLED after it returns.
+        self._draw_lock = threading.Lock()
 
         # internal eye state
         self.WIDTH = OledDisplay.WIDTH
@@ -44,12 +60,29 @@ class AnimationManager:
         self.right_eye_x = 32 + self.ref_eye_width + self.ref_space_between_eye
         self.right_eye_y = 32
 
-        self.image = None
-        self.draw = None
+        # Pre-rendered eye masks (0/255) keyed by (width, height); the eye
+        # sizes only take a handful of values, so each frame is two slice
+        # copies into the framebuffer.
+        self._sprites: Dict[Tuple[int, int], "np.ndarray"] = {}
+
+        # Geometry of the frame currently on the panel; a repeated frame is
+        # neither redrawn nor sent. Reset whenever something else may have
+        # drawn on the OLED.
+        self._last_frame_key: Optional[Tuple[int, ...]] = None
+
+        # Packed SSD1306 frames keyed by the same geometry; after the first
+        # pass of the idle loop every frame is a dict lookup.
+        self._frames: Dict[Tuple[int, ...], bytes] = {}
+
+        # Per-frame eye height deltas for a blink, keyed by speed.
+        self._blink_schedules: Dict[int, Tuple[int, ...]] = {}
+
+        # The frame is a persistent 8-bit numpy buffer, packed into the
+        # SSD1306 page layout only when it is sent.
+        self._fb = None
         try:
-            if Image is not None:
-                self.image = Image.new("1", (self.WIDTH, self.HEIGHT))
-                self.draw = ImageDraw.Draw(self.image)
+            if np is not None and Image is not None:
+                self._fb = np.zeros((self.HEIGHT, self.WIDTH), dtype=np.uint8)
         except Exception:
             self.log.exception("Failed to create animation image buffer.")
 
@@ -58,53 +91,110 @@ class AnimationManager:
     # -------------------------------------------------
     def pause(self) -> None:
         try:
-            self._pause_event.set()
+            self._run_event.clear()
+            self._interrupt.set()
+            with self._draw_lock:
+                pass
         except Exception:
             self.log.exception("Failed to pause animation.")
 
     def resume(self) -> None:
         try:
-            self._pause_event.clear()
+            self._last_frame_key = None
+            self._interrupt.clear()
+            self._run_event.set()
         except Exception:
             self.log.exception("Failed to resume animation.")
 
     def stop(self) -> None:
         try:
             self._stop_event.set()
+            self._interrupt.set()
         except Exception:
             self.log.exception("Failed to stop animation.")
 
     # -------------------------------------------------
     # Internal drawing helpers
     # -------------------------------------------------
+    def _eye_sprite(self, width: int, height: int):
+        key = (width, height)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            shape = Image.new("L", (width + 1, height + 1))
+            ImageDraw.Draw(shape).rounded_rectangle(
+                (0, 0, width, height),
+                radius=self.ref_corner_radius,
+                fill=255,
+            )
+            sprite = np.array(shape, dtype=np.uint8)
+            self._sprites[key] = sprite
+        return sprite
+
+    def _blit(self, sprite, x: int, y: int) -> None:
+        """
+        Copy a sprite into the framebuffer at (x, y), clipped to the screen.
+        """
+        h, w = sprite.shape
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + w, self.WIDTH), min(y + h, self.HEIGHT)
+        if x0 >= x1 or y0 >= y1:
+            return
+        self._fb[y0:y1, x0:x1] = sprite[y0 - y : y1 - y, x0 - x : x1 - x]
+
     def _draw_eyes(self) -> None:
-        if self.oled.display is None or self.image is None or self.draw is None:
+        if self.oled.display is None or self._fb is None:
             return
-        try:
-            self.draw.rectangle((0, 0, self.WIDTH, self.HEIGHT), fill=0)
+        with self._draw_lock:
+            if self._run_event.is_set():
+                self._draw_frame()
 
+    def _draw_frame(self) -> None:
+        try:
             lx = int(self.left_eye_x - self.left_eye_width / 2)
             ly = int(self.left_eye_y - self.left_eye_height / 2)
             rx = int(self.right_eye_x - self.right_eye_width / 2)
             ry = int(self.right_eye_y - self.right_eye_height / 2)
 
-            self.draw.rounded_rectangle(
-                (lx, ly, lx + self.left_eye_width, ly + self.left_eye_height),
-                radius=self.ref_corner_radius,
-                fill=255,
-            )
-
-            self.draw.rounded_rectangle(
-                (rx, ry, rx + self.right_eye_width, ry + self.right_eye_height),
-                radius=self.ref_corner_radius,
-                fill=255,
+            key = (
+                lx,
+                ly,
+                self.left_eye_width,
+                self.left_eye_height,
+                rx,
+                ry,
+                self.right_eye_width,
+                self.right_eye_height,
             )
-
-            self.oled.display.image(self.image)
-            self.oled.display.show()
+            if key == self._last_frame_key:
+                return
+            self._last_frame_key = key
+
+            frame = self._frames.get(key)
+            if frame is None:
+                self._fb.fill(0)
+                self._blit(
+                    self._eye_sprite(self.left_eye_width, self.left_eye_height), lx, ly
+                )
+                self._blit(
+                    self._eye_sprite(self.right_eye_width, self.right_eye_height), rx, ry
+                )
+                frame = self._pack_frame()
+                if len(self._frames) >= self.FRAME_CACHE_MAX:
+                    self._frames.clear()
+                self._frames[key] = frame
+
+            self.oled.show_raw(frame)
         except Exception:
             self.log.exception("Failed to draw eyes.")
 
+    def _pack_frame(self):
+        """
+        Pack the framebuffer into SSD1306 layout: each 8-row page becomes
+        WIDTH column bytes with the top row in bit 0.
+        """
+        pages = self._fb.reshape(self.HEIGHT // 8, 8, self.WIDTH).transpose(0, 2, 1)
+        return np.packbits(pages, axis=-1, bitorder="little").tobytes()
+
     def _center_eyes(self) -> None:
         self.left_eye_height = self.ref_eye_height
         self.left_eye_width = self.ref_eye_width
@@ -123,28 +213,32 @@ class AnimationManager:
 
     def _blink(self, speed: int = 12) -> None:
         try:
-            for _ in range(3):
-                self.left_eye_height -= speed
-                self.right_eye_height -= speed
-                self._draw_eyes()
-                time.sleep(0.02)
-
-            for _ in range(3):
-                self.left_eye_height += speed
-                self.right_eye_height += speed
+            schedule = self._blink_schedules.get(speed)
+            if schedule is None:
+                # Three steps closing, three steps opening.
+                schedule = (-speed,) * 3 + (speed,) * 3
+                self._blink_schedules[speed] = schedule
+
+            wait = self._interrupt.wait
+            for dh in schedule:
+                self.left_eye_height += dh
+                self.right_eye_height += dh
                 self._draw_eyes()
-                time.sleep(0.02)
+                if wait(0.02):
+                    break
         except Exception:
             self.log.exception("Blink animation failed.")
 
     def _slow_move(self, direction: str, steps: int = 10, delay: float = 0.05) -> None:
         try:
             dx = 2 if direction == "right" else -2
+            wait = self._interrupt.wait
             for _ in range(steps):
                 self.left_eye_x += dx
                 self.right_eye_x += dx
                 self._draw_eyes()
-                time.sleep(delay)
+                if wait(delay):
+                    break
         except Exception:
             self.log.exception("Slow move animation failed.")
 
@@ -162,41 +256,51 @@ class AnimationManager:
         """
         self.log.info("Animation thread started.")
 
+        # Bound once; the loop body runs for the life of the process.
+        # wait() returns True when pause()/stop() interrupts the sequence,
+        # which restarts it from the top once resumed.
+        wait = self._interrupt.wait
+        monotonic = time.monotonic
+
         while not self._stop_event.is_set():
             try:
-                if self._pause_event.is_set():
-                    time.sleep(0.05)
+                # Sleeps until resumed; the timeout lets stop() be noticed.
+                if not self._run_event.wait(timeout=1.0):
                     continue
 
-                start = time.time()
+                start = monotonic()
 
                 # Center
                 self._center_eyes()
-                time.sleep(0.5)
+                if wait(0.5):
+                    continue
 
                 # Slow left
                 self._slow_move("left")
-                time.sleep(0.3)
+                if wait(0.3):
+                    continue
 
                 # Center
                 self._center_eyes()
-                time.sleep(0.3)
+                if wait(0.3):
+                    continue
 
                 # Slow right
                 self._slow_move("right")
-                time.sleep(0.3)
+                if wait(0.3):
+                    continue
 
                 # Back to center and blink
                 self._center_eyes()
                 self._blink()
 
                 # Ensure roughly 5s total
-                elapsed = time.time() - start
+                elapsed = monotonic() - start
                 remaining = max(0.0, 5.0 - elapsed)
-                time.sleep(remaining)
+                wait(remaining)
             except Exception:
                 self.log.exception("Animation loop iteration failed.")
-                time.sleep(0.1)
+                wait(0.1)
 
         self.log.info("Animation thread exiting.")
 
@@ -1,7 +1,10 @@
+import collections
 import logging
+import threading
 import time
 from dataclasses import dataclass
 from enum import Enum, auto
+from typing import Callable, Dict, Optional
 
 try:
     import RPi.GPIO as GPIO
@@ -21,9 +24,55 @@ class ButtonEvent:
     event_type: ButtonEventType
 
 
+class ButtonEventChannel:
+    """
+    Event channel from the button producers (GPIO callbacks, timers) to the
+    main loop, used in place of queue.Queue.
+
+    deque.append/popleft are atomic, so producers never take the queue's
+    mutex; the Event only wakes the consumer when it is waiting. When
+    `maxlen` events are already pending, new events are dropped with a
+    warning rather than the oldest, so a queued K1_LONG_CHAT_START is never
+    lost. K1_LONG_CHAT_END is always accepted, so a started chat is always
+    ended; the controller ignores an end whose start was dropped.
+    """
+
+    def __init__(self, maxlen: int = 64) -> None:
+        self.log = logging.getLogger("buttons")
+        self._maxlen = maxlen
+        self._q: "collections.deque[ButtonEvent]" = collections.deque()
+        self._ev = threading.Event()
+
+    def put(self, event: ButtonEvent) -> None:
+        if (
+            len(self._q) >= self._maxlen
+            and event.event_type is not ButtonEventType.K1_LONG_CHAT_END
+        ):
+            self.log.warning("Event channel full, dropping %s", event.event_type)
+            return
+        self._q.append(event)
+        self._ev.set()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[ButtonEvent]:
+        """
+        Returns the next event, blocking until one arrives. Returns None if
+        `timeout` expires first.
+        """
+        while True:
+            try:
+                return self._q.popleft()
+            except IndexError:
+                pass
+            if not self._ev.wait(timeout):
+                return None
+            # Clear before re-checking the deque, so an event put after the
+            # check still leaves the flag set.
+            self._ev.clear()
+
+
 class ButtonListener:
     """
-    Single thread that monitors buttons and pushes ButtonEvent into a queue.
+    Monitors buttons and pushes ButtonEvent into a queue.
 
     - K2: object detection (single press)
     - K3: short press (< 1s) → image capture
@@ -32,25 +81,54 @@ class ButtonListener:
     For K1 long press chat:
       - On K1 press crossing 1s threshold: send K1_LONG_CHAT_START
       - On K1 release after long press:   send K1_LONG_CHAT_END
+
+    Presses are detected with GPIO edge interrupts (add_event_detect), so
+    nothing runs while the buttons are idle; the K1 threshold is a timer
+    armed on press, and button levels are re-read once a bounce has settled.
+    If edge detection is unavailable, run() falls back to polling the pins.
     """
 
     K1_PIN = 17  # Push-to-talk (long press)
     K2_PIN = 27  # Object detection
     K3_PIN = 22  # Image capture (short press)
 
+    LONG_PRESS_SEC = 1.0
+    BOUNCE_MS = 20
+    # Edges inside the bounce window are dropped by RPi.GPIO, including the
+    # final one, so the level is read again once the contact has settled.
+    SETTLE_SEC = 0.05
+
+    # Polling fallback: fast while a button is held (long-press timing),
+    # slower while idle. The idle rate still catches a quick tap.
+    POLL_ACTIVE_SEC = 0.01
+    POLL_IDLE_SEC = 0.05
+
     def __init__(self, event_queue) -> None:
         self.log = logging.getLogger("buttons")
         self.event_queue = event_queue
+        self._stop_event = threading.Event()
 
         self._k1_pressed = False
         self._k1_press_time = 0.0
         self._k1_long_sent = False
+        # Guards K1 state between the edge callback and the long-press timer.
+        self._k1_lock = threading.Lock()
+        self._k1_timer: Optional[threading.Timer] = None
+
+        self._k2_pressed = False
+        self._k2_lock = threading.Lock()
 
         self._k3_pressed = False
         self._k3_press_time = 0.0
+        self._k3_lock = threading.Lock()
+
+        # Per-pin re-read armed on every edge, see _arm_settle().
+        self._settle_timers: Dict[int, threading.Timer] = {}
+        self._settle_lock = threading.Lock()
 
         # Track whether GPIO was successfully initialised.
         self._gpio_ok = False
+        self._edge_ok = False
 
         try:
             if GPIO is None:
@@ -69,12 +147,36 @@ class ButtonListener:
             self._gpio_ok = False
             self.log.exception("Failed to initialize GPIO: %s", e)
 
+        if self._gpio_ok:
+            self._setup_edge_detection()
+
+    def _setup_edge_detection(self) -> None:
+        try:
+            GPIO.add_event_detect(
+                self.K1_PIN, GPIO.BOTH, callback=self._on_k1_edge, bouncetime=self.BOUNCE_MS
+            )
+            GPIO.add_event_detect(
+                self.K2_PIN, GPIO.BOTH, callback=self._on_k2_edge, bouncetime=self.BOUNCE_MS
+            )
+            GPIO.add_event_detect(
+                self.K3_PIN, GPIO.BOTH, callback=self._on_k3_edge, bouncetime=self.BOUNCE_MS
+            )
+            self._edge_ok = True
+        except Exception as e:
+            self._edge_ok = False
+            for pin in (self.K1_PIN, self.K2_PIN, self.K3_PIN):
+                try:
+                    GPIO.remove_event_detect(pin)
+                except Exception:
+                    pass
+            self.log.warning("GPIO edge detection unavailable, polling instead: %s", e)
+
     def _read_pin(self, pin: int) -> bool:
         """
         Returns True if button is pressed (active low).
+
+        Only called once GPIO has been initialised.
         """
-        if GPIO is None or not getattr(self, "_gpio_ok", False):
-            return False
         try:
             return GPIO.input(pin) == GPIO.LOW
         except Exception:
@@ -84,20 +186,156 @@ class ButtonListener:
     def run(self) -> None:
         self.log.info("Button listener thread started.")
         try:
+            if self._edge_ok or not self._gpio_ok:
+                # Either the GPIO edge callbacks produce the events, or there
+                # are no buttons at all; nothing to poll in both cases.
+                self._stop_event.wait()
+                return
+
+            wait = self._stop_event.wait
             while True:
                 self._poll_k1()
                 self._poll_k2()
                 self._poll_k3()
-                time.sleep(0.01)
+                any_pressed = self._k1_pressed or self._k3_pressed
+                # Returns True as soon as stop() is called.
+                if wait(self.POLL_ACTIVE_SEC if any_pressed else self.POLL_IDLE_SEC):
+                    break
         except Exception:
             self.log.exception("Button listener crashed.")
 
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._edge_ok:
+            for pin in (self.K1_PIN, self.K2_PIN, self.K3_PIN):
+                try:
+                    GPIO.remove_event_detect(pin)
+                except Exception:
+                    self.log.exception("Failed to remove edge detection on pin %s", pin)
+            self._edge_ok = False
+        with self._settle_lock:
+            for timer in self._settle_timers.values():
+                timer.cancel()
+            self._settle_timers.clear()
+        with self._k1_lock:
+            if self._k1_timer is not None:
+                self._k1_timer.cancel()
+                self._k1_timer = None
+
     # -------------------------------------------------
-    # K1 – push-to-talk (long press >= 1s)
+    # Edge callbacks (run on the GPIO library's callback thread)
     # -------------------------------------------------
+    def _arm_settle(self, pin: int, update: Callable[[bool], None]) -> None:
+        """
+        Re-reads `pin` SETTLE_SEC after its latest edge. The callback's own
+        read can land on a bounce, and the edge that ends the bounce may
+        fall inside the bounce window and never be delivered.
+        """
+        def settle() -> None:
+            with self._settle_lock:
+                if self._settle_timers.get(pin) is timer:
+                    del self._settle_timers[pin]
+            if self._stop_event.is_set():
+                return
+            try:
+                update(self._read_pin(pin))
+            except Exception:
+                self.log.exception("Error re-reading pin %s", pin)
+
+        timer = threading.Timer(self.SETTLE_SEC, settle)
+        timer.daemon = True
+        with self._settle_lock:
+            previous = self._settle_timers.get(pin)
+            if previous is not None:
+                previous.cancel()
+            self._settle_timers[pin] = timer
+        timer.start()
+
+    def _on_k1_edge(self, channel: int) -> None:
+        try:
+            self._update_k1(self._read_pin(self.K1_PIN))
+            self._arm_settle(self.K1_PIN, self._update_k1)
+        except Exception:
+            self.log.exception("Error handling K1 edge.")
+
+    def _update_k1(self, pressed: bool) -> None:
+        with self._k1_lock:
+            if pressed and not self._k1_pressed:
+                self._k1_pressed = True
+                self._k1_press_time = time.time()
+                self._k1_long_sent = False
+                self._k1_timer = threading.Timer(
+                    self.LONG_PRESS_SEC, self._on_k1_long_press
+                )
+                self._k1_timer.daemon = True
+                self._k1_timer.start()
+            elif not pressed and self._k1_pressed:
+                self._release_k1()
+
+    def _release_k1(self) -> None:
+        # Caller holds _k1_lock.
+        if self._k1_timer is not None:
+            self._k1_timer.cancel()
+            self._k1_timer = None
+        if self._k1_long_sent:
+            self.event_queue.put(ButtonEvent(ButtonEventType.K1_LONG_CHAT_END))
+        self._k1_pressed = False
+        self._k1_long_sent = False
+
+    def _on_k1_long_press(self) -> None:
+        try:
+            with self._k1_lock:
+                self._k1_timer = None
+                if not self._k1_pressed or self._k1_long_sent:
+                    return
+                if self._read_pin(self.K1_PIN):
+                    self._k1_long_sent = True
+                    self.event_queue.put(ButtonEvent(ButtonEventType.K1_LONG_CHAT_START))
+                else:
+                    # The release edge was lost; the button is already up.
+                    self._release_k1()
+        except Exception:
+            self.log.exception("Error handling K1 long press.")
+
+    def _on_k2_edge(self, channel: int) -> None:
+        try:
+            # Decided on the settled level only, so a bounce on release
+            # cannot trigger a second detection.
+            self._arm_settle(self.K2_PIN, self._update_k2)
+        except Exception:
+            self.log.exception("Error handling K2 edge.")
+
+    def _update_k2(self, pressed: bool) -> None:
+        with self._k2_lock:
+            if pressed and not self._k2_pressed:
+                self._k2_pressed = True
+                self.event_queue.put(ButtonEvent(ButtonEventType.K2_OBJECT_DETECT))
+            elif not pressed:
+                self._k2_pressed = False
+
+    def _on_k3_edge(self, channel: int) -> None:
+        try:
+            self._update_k3(self._read_pin(self.K3_PIN))
+            self._arm_settle(self.K3_PIN, self._update_k3)
+        except Exception:
+            self.log.exception("Error handling K3 edge.")
+
+    def _update_k3(self, pressed: bool) -> None:
+        with self._k3_lock:
+            now = time.time()
+            if pressed and not self._k3_pressed:
+                self._k3_pressed = True
+                self._k3_press_time = now
+            elif not pressed and self._k3_pressed:
+                if now - self._k3_press_time < self.LONG_PRESS_SEC:
+                    self.event_queue.put(ButtonEvent(ButtonEventType.K3_SHORT_CAPTURE))
+                self._k3_pressed = False
+
+    # -------------------------------------------------
+    # Polling fallback
+    # -------------------------------------------------
+    # K1 – push-to-talk (long press >= 1s)
     def _poll_k1(self) -> None:
-        if GPIO is None:
-            return
         try:
             pressed = self._read_pin(self.K1_PIN)
             now = time.time()
@@ -122,12 +360,8 @@ class ButtonListener:
         except Exception:
             self.log.exception("Error polling K1.")
 
-    # -------------------------------------------------
     # K2 – object detection
-    # -------------------------------------------------
     def _poll_k2(self) -> None:
-        if GPIO is None:
-            return
         try:
             pressed = self._read_pin(self.K2_PIN)
             if pressed:
@@ -141,12 +375,8 @@ class ButtonListener:
         except Exception:
             self.log.exception("Error polling K2.")
 
-    # -------------------------------------------------
     # K3 – short press only (image capture)
-    # -------------------------------------------------
     def _poll_k3(self) -> None:
-        if GPIO is None:
-            return
         try:
             pressed = self._read_pin(self.K3_PIN)
             now = time.time()
@@ -0,0 +1,117 @@
+import logging
+import sys
+from typing import Optional, Tuple
+
+sys.path.append("/usr/lib/python3/dist-packages")
+try:
+    import numpy as np
+    from picamera2 import MappedArray, Picamera2
+except Exception:  # pragma: no cover - not on Pi
+    np = None
+    MappedArray = None
+    Picamera2 = None
+
+
+class Camera:
+    """
+    Single long-lived Picamera2 instance.
+
+    The sensor is configured and started once at boot; button handlers only
+    grab frames from the running camera and never call start()/stop().
+
+    Besides the full-resolution "main" stream used for saved photos, a small
+    "lores" stream is configured for object detection, so YOLO never has to
+    handle a full sensor frame. Its "RGB888" format is laid out as B, G, R,
+    the channel order YOLO expects for numpy input.
+    """
+
+    LORES_SIZE: Tuple[int, int] = (640, 480)
+    # The still configuration defaults to a single buffer, so the sensor
+    # stalls while Python holds it. Frames are copied out and released at
+    # once, so two is enough to keep one filling; each full-resolution
+    # buffer costs width x height x 3 bytes of CMA memory.
+    BUFFER_COUNT = 2
+
+    def __init__(self) -> None:
+        self.log = logging.getLogger("camera")
+        self.cam = None
+        self.has_lores = False
+        # Buffer reused by capture_array("lores"), allocated on first capture
+        # once the stream's shape is known.
+        self._lores_buf: Optional["np.ndarray"] = None
+        try:
+            if Picamera2 is None:
+                raise RuntimeError("Picamera2 not available.")
+            self.cam = Picamera2()
+            self._configure()
+            self.cam.start()
+        except Exception as e:
+            self.log.exception("Failed to initialize camera: %s", e)
+            self.cam = None
+
+    def _configure(self) -> None:
+        try:
+            self.cam.configure(
+                self.cam.create_still_configuration(
+                    lores={"size": self.LORES_SIZE, "format": "RGB888"},
+                    buffer_count=self.BUFFER_COUNT,
+                )
+            )
+            self.has_lores = True
+        except Exception:
+            # Older ISPs only offer YUV for lores; fall back to main only.
+            self.log.warning("RGB lores stream not supported, using main only.")
+            self.cam.configure(
+                self.cam.create_still_configuration(buffer_count=self.BUFFER_COUNT)
+            )
+            self.has_lores = False
+
+    @property
+    def available(self) -> bool:
+        return self.cam is not None
+
+    def capture_array(self, stream: str = "main"):
+        """
+        Returns the current frame of `stream` as a numpy array, or None on
+        failure.
+
+        For "lores" (detection, every K2 press) the array is a buffer owned
+        by Camera and is overwritten by the next lores capture; callers that
+        keep it beyond that must copy it. Other streams get a fresh copy the
+        caller owns, so a full-resolution frame is not kept alive between
+        the occasional photos.
+        """
+        if self.cam is None:
+            self.log.error("Camera not available.")
+            return None
+        try:
+            request = self.cam.capture_request()
+            try:
+                # Copy straight out of the mapped camera buffer and hand the
+                # buffer back to the driver immediately.
+                with MappedArray(request, stream) as m:
+                    src = m.array
+                    if stream != "lores":
+                        buf = src.copy()
+                    else:
+                        buf = self._lores_buf
+                        if buf is None or buf.shape != src.shape or buf.dtype != src.dtype:
+                            buf = self._lores_buf = np.empty_like(src)
+                        np.copyto(buf, src)
+            finally:
+                request.release()
+            return buf
+        except Exception:
+            self.log.exception("Failed to capture frame.")
+            return None
+
+    def close(self) -> None:
+        if self.cam is None:
+            return
+        try:
+            self.cam.stop()
+            self.cam.close()
+        except Exception:
+            self.log.exception("Failed to close camera.")
+        finally:
+            self.cam = None
@@ -1,5 +1,9 @@
+import fcntl
 import logging
-from typing import List
+import os
+import threading
+import time
+from typing import List, Optional
 
 try:
     import board
@@ -15,9 +19,23 @@ except Exception:  # pragma: no cover - hardware not available on dev machine
     adafruit_ssd1306 = None
 
 
+# SSD1306 addressing commands
+SET_COL_ADDR = 0x21
+SET_PAGE_ADDR = 0x22
+
+OLED_I2C_BUS = "/dev/i2c-1"
+OLED_I2C_ADDR = 0x3C
+I2C_SLAVE = 0x0703  # linux/i2c-dev.h
+
+
 class OledDisplay:
     WIDTH = 128
     HEIGHT = 64
+    PAGES = HEIGHT // 8
+
+    # Minimum interval between streaming-text refreshes (~10 Hz).
+    STREAM_MIN_INTERVAL_NS = 100_000_000
+    I2C_FREQUENCY = 400_000
 
     def __init__(self) -> None:
         self.log = logging.getLogger("oled")
@@ -26,11 +44,28 @@ class OledDisplay:
         self.draw = None
         self.font = None
 
+        # Copy of the framebuffer as last sent to the panel, used to only
+        # transfer the 8-row pages that changed.
+        self._prev_buf: Optional[bytearray] = None
+        self._last_stream_ns = 0
+        # Held while the framebuffer is updated and flushed. The main
+        # thread, the animation thread and the recorder's chunk thread
+        # (partial transcripts) all draw, and _flush() diffs against
+        # _prev_buf and shares one i2c handle.
+        self._lock = threading.Lock()
+
+        # Raw i2c-dev handle for framebuffer writes; None falls back to the
+        # adafruit driver.
+        self._fd: Optional[int] = None
+
         try:
             if busio is None or adafruit_ssd1306 is None or Image is None:
                 raise RuntimeError("OLED hardware libraries not available.")
 
-            i2c = busio.I2C(board.SCL, board.SDA)
+            # SSD1306 supports Fast-mode. On Linux the bus clock is set by
+            # the i2c_arm_baudrate dtparam (see README); this is the rate
+            # requested on ports where busio controls it.
+            i2c = busio.I2C(board.SCL, board.SDA, frequency=self.I2C_FREQUENCY)
             self.display = adafruit_ssd1306.SSD1306_I2C(
                 self.WIDTH, self.HEIGHT, i2c
             )
@@ -41,30 +76,123 @@ class OledDisplay:
             except Exception:
                 self.font = None
 
+            self._open_i2c_dev()
             self.clear()
         except Exception as e:
             self.log.exception("Failed to initialize OLED: %s", e)
 
+    def _open_i2c_dev(self) -> None:
+        """
+        The adafruit driver is only used for the one-off init sequence.
+        Frames are written through a raw /dev/i2c-1 handle: one write()
+        syscall per transfer instead of going through busio's locking and
+        buffer slicing.
+        """
+        try:
+            fd = os.open(OLED_I2C_BUS, os.O_RDWR)
+            try:
+                fcntl.ioctl(fd, I2C_SLAVE, OLED_I2C_ADDR)
+            except Exception:
+                os.close(fd)
+                raise
+            self._fd = fd
+        except Exception as e:
+            self._fd = None
+            self.log.warning("Using adafruit driver for OLED writes: %s", e)
+
     def clear(self) -> None:
         try:
             if self.display is None:
                 return
-            self.display.fill(0)
-            self.display.show()
+            with self._lock:
+                self.display.fill(0)
+                self._flush()
         except Exception:
             self.log.exception("Failed to clear OLED.")
 
+    def show_raw(self, data) -> None:
+        """
+        Display a framebuffer already in SSD1306 layout: PAGES * WIDTH bytes,
+        page by page, one byte per column with bit 0 as the top row. Skips
+        the PIL conversion done by the driver's image().
+        """
+        try:
+            if self.display is None:
+                return
+            with self._lock:
+                self.display.buffer[1:] = data
+                self._flush()
+        except Exception:
+            self.log.exception("Failed to show raw frame on OLED.")
+
+    def _flush(self) -> None:
+        """
+        Send the framebuffer to the panel, skipping pages that did not change
+        since the last flush. Changed pages are sent as one contiguous band.
+        Caller holds _lock.
+        """
+        # SSD1306_I2C keeps the 0x40 data control byte at buffer[0], followed
+        # by PAGES * WIDTH bytes of page data.
+        buf = self.display.buffer
+        width = self.WIDTH
+        prev = self._prev_buf
+
+        if prev is None:
+            first, last = 0, self.PAGES - 1
+        else:
+            view = memoryview(buf)
+            prev_view = memoryview(prev)
+            changed = [
+                page
+                for page in range(self.PAGES)
+                if view[1 + page * width : 1 + (page + 1) * width]
+                != prev_view[page * width : (page + 1) * width]
+            ]
+            if not changed:
+                return
+            first, last = changed[0], changed[-1]
+
+        cmds = (SET_COL_ADDR, 0, width - 1, SET_PAGE_ADDR, first, last)
+        if self._fd is not None:
+            # 0x00 control byte: the rest of the transfer is commands.
+            os.write(self._fd, bytes((0x00,) + cmds))
+        else:
+            for cmd in cmds:
+                self.display.write_cmd(cmd)
+
+        # The byte before the first dirty page temporarily becomes the data
+        # control byte, so the band goes out without copying the buffer.
+        start = first * width
+        end = 1 + (last + 1) * width
+        saved = buf[start]
+        buf[start] = 0x40
+        try:
+            if self._fd is not None:
+                os.write(self._fd, memoryview(buf)[start:end])
+            else:
+                # Same bus locking the driver's own show() uses.
+                with self.display.i2c_device:
+                    self.display.i2c_device.write(buf, start=start, end=end)
+        finally:
+            buf[start] = saved
+
+        if prev is None:
+            self._prev_buf = bytearray(buf[1:])
+        else:
+            prev[start : end - 1] = buf[start + 1 : end]
+
     def _draw_text_lines(self, lines: List[str]) -> None:
         if self.display is None or self.image is None or self.draw is None:
             return
         try:
-            self.draw.rectangle((0, 0, self.WIDTH, self.HEIGHT), fill=0)
-            y = 0
-            for line in lines[:4]:
-                self.draw.text((0, y), line, font=self.font, fill=255)
-                y += 16
-            self.display.image(self.image)
-            self.display.show()
+            with self._lock:
+                self.draw.rectangle((0, 0, self.WIDTH, self.HEIGHT), fill=0)
+                y = 0
+                for line in lines[:4]:
+                    self.draw.text((0, y), line, font=self.font, fill=255)
+                    y += 16
+                self.display.image(self.image)
+                self._flush()
         except Exception:
             self.log.exception("Failed to draw text on OLED.")
 
@@ -74,11 +202,20 @@ class OledDisplay:
         except Exception:
             self.log.exception("show_text failed.")
 
-    def show_streaming_text(self, text: str) -> None:
+    def show_streaming_text(self, text: str, force: bool = False) -> None:
         """
         For streaming LLM tokens. We keep only the last few lines that fit.
+
+        Refreshes are rate limited to STREAM_MIN_INTERVAL_NS; intermediate
+        updates are dropped, so callers should pass force=True for the final
+        text.
         """
         try:
+            now = time.monotonic_ns()
+            if not force and now - self._last_stream_ns < self.STREAM_MIN_INTERVAL_NS:
+                return
+            self._last_stream_ns = now
+
             # naive word wrap based on character count
             max_chars_per_line = 21
             words = text.split()
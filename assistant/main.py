@@ -1,11 +1,10 @@
 import threading
 import logging
-import queue
 import time
 
 from controller import Controller
 from hardware.animation import AnimationManager
-from hardware.buttons import ButtonListener, ButtonEvent
+from hardware.buttons import ButtonEventChannel, ButtonListener
 from hardware.oled import OledDisplay
 
 
@@ -20,8 +19,10 @@ def main() -> None:
     setup_logging()
     log = logging.getLogger("main")
 
+    controller = None
+    button_listener = None
     try:
-        event_queue: "queue.Queue[ButtonEvent]" = queue.Queue()
+        event_queue = ButtonEventChannel()
 
         oled = OledDisplay()
         animation = AnimationManager(oled)
@@ -56,6 +57,11 @@ def main() -> None:
         log.info("Shutting down (KeyboardInterrupt).")
     except Exception as e:
         log.exception("Fatal error in main: %s", e)
+    finally:
+        if button_listener is not None:
+            button_listener.stop()
+        if controller is not None:
+            controller.close()
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 import os
 import pathlib
+import shutil
 import sys
 import urllib.request
 
@@ -21,6 +22,45 @@ def download(url: str, dest: pathlib.Path) -> None:
         print(f"Failed to download {url}: {e}", file=sys.stderr)
 
 
+def export_yolo_onnx(pt_path: pathlib.Path) -> None:
+    """
+    Export the YOLO model to ONNX (models/yolo.onnx) for onnxruntime
+    inference. Dynamic input size, since detection escalates through
+    several sizes up to 640.
+    """
+    onnx_path = pt_path.with_suffix(".onnx")
+    if onnx_path.exists():
+        print(f"[skip] {onnx_path} already exists")
+        return
+    if not pt_path.exists():
+        return
+    print(f"[export] {pt_path} -> {onnx_path}")
+    try:
+        from ultralytics import YOLO
+
+        YOLO(str(pt_path)).export(
+            format="onnx", imgsz=320, dynamic=True, simplify=True
+        )
+    except Exception as e:
+        print(f"Failed to export YOLO to ONNX: {e}", file=sys.stderr)
+
+
+def whisper_model_size() -> str:
+    """
+    base.en when the board has room for it next to the LLM (4 GB and 8 GB
+    Pi 5), tiny.en otherwise. WHISPER_MODEL overrides the choice.
+    """
+    override = os.environ.get("WHISPER_MODEL")
+    if override:
+        return override
+    try:
+        ram = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return "tiny.en"
+    # A 4 GB board reports a little less than 4 GiB after firmware carve-outs.
+    return "base.en" if ram >= 3.5 * 1024**3 else "tiny.en"
+
+
 def main() -> None:
     # LLM – tiny GGUF model suitable for Pi 5
     # You can replace this with any GGUF path you prefer.
@@ -35,6 +75,7 @@ def main() -> None:
         "https://github.com/ultralytics/assets/releases/download/v0.0.0/yolov8n.pt"
     )
     download(yolo_url, MODELS_DIR / "yolo.pt")
+    export_yolo_onnx(MODELS_DIR / "yolo.pt")
 
     # Vosk STT small English model → models/vosk/
     # Official mirror from alphacephei.
@@ -63,9 +104,31 @@ def main() -> None:
                     ):
                         item.rename(target_dir)
                         break
+
+            # The RNNLM rescoring model is large and slow to page in from the
+            # SD card; drop it unless explicitly requested.
+            rnnlm_dir = target_dir / "rnnlm"
+            if rnnlm_dir.exists() and not os.environ.get("VOSK_KEEP_RNNLM"):
+                print(f"[remove] {rnnlm_dir} (set VOSK_KEEP_RNNLM=1 to keep)")
+                shutil.rmtree(rnnlm_dir)
     except Exception as e:
         print(f"Failed to unpack Vosk model: {e}", file=sys.stderr)
 
+    # Optional Whisper STT (faster-whisper / CTranslate2) → models/whisper/
+    if os.environ.get("STT_ENGINE", "").lower() == "whisper":
+        whisper_dir = MODELS_DIR / "whisper"
+        if whisper_dir.exists():
+            print(f"[skip] {whisper_dir} already exists")
+        else:
+            try:
+                from faster_whisper import download_model
+
+                size = whisper_model_size()
+                print(f"[download] whisper {size} -> {whisper_dir}")
+                download_model(size, output_dir=str(whisper_dir))
+            except Exception as e:
+                print(f"Failed to download Whisper model: {e}", file=sys.stderr)
+
 
 if __name__ == "__main__":
     main()